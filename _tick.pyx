@@ -0,0 +1,20 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled arrival pass for Game.update_troops.
+
+Build in place with ``python setup.py build_ext --inplace``; referee.py uses
+it instead of the Numba or NumPy version whenever it can be imported.
+"""
+
+
+cpdef void arrive(
+    int[::1] owner,
+    int[::1] num_cyborgs,
+    int[::1] dst,
+    int[:, ::1] totals,
+    unsigned char[:, ::1] present,
+):
+    """Sum arriving cyborgs into ``totals[dst, owner]`` and flag ``present``."""
+    cdef Py_ssize_t i
+    for i in range(dst.shape[0]):
+        totals[dst[i], owner[i]] += num_cyborgs[i]
+        present[dst[i], owner[i]] = 1
@@ -1,255 +1,444 @@
-import random
+import functools
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; Game falls back to np.add.at
+    njit = None
 
 
 class Visualizer:
-    def __init__(self, game):
-        self.game = game
+    """Draws a game, redrawing only what changes between turns.
 
-    def visualize(self):
-        fig, ax = plt.subplots()
+    Links are static and drawn once. Factories, troops and bombs are animated
+    artists that are blitted over a cached background on each visualize call.
+    Pass headless=True to render into an off-screen Agg canvas (e.g. while
+    recording rollouts); the frame is then in self.fig.canvas.buffer_rgba().
+    """
+
+    # Indexed by owner: 0 for neutral, 1 for player 1, 2 for player 2
+    OWNER_COLORS = np.array(["grey", "blue", "red"])
 
+    def __init__(self, game, headless=False):
+        self.game = game
+        # Distance labels are skipped on denser maps, where they would clutter
+        self.max_link_labels = 100
+        # Above this many troops in flight, troop sizes show cyborg counts
+        # instead of one text label per troop
+        self.max_labels = 50
+        # Factories never move, so their positions are computed once
+        self._positions = self.compute_positions()
+
+        if headless:
+            self.fig = Figure()
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
+        else:
+            self.fig, self.ax = plt.subplots()
+        self.draw_links()
+        self.create_artists()
+        self.ax.axis("equal")  # Set equal scaling by changing axis limits
+        self.ax.set_title("Game State Visualization")
+
+        # Full redraws (first frame, window resize, savefig) refresh the
+        # cached background and repaint the animated artists on top of it
+        self._background = None
+        self.fig.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def draw_links(self):
         # Initialize factories positions (this is a heuristic and might not reflect actual distances)
         positions = self.generate_positions()
 
-        # Plot links
-        for (f1, f2), distance in self.game.distances.items():
-            x1, y1 = positions[f1]
-            x2, y2 = positions[f2]
-            ax.plot([x1, x2], [y1, y2], "k-", lw=1, alpha=0.6)  # Draw links
+        # Plot links, all in a single collection
+        links = self.game.links
+        segments = positions[links]  # (link, endpoint, xy)
+        self.ax.add_collection(
+            LineCollection(segments, colors="k", linewidths=1, alpha=0.6)
+        )
+        if len(links) <= self.max_link_labels:
             # Optionally, annotate the distance
-            mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-            ax.text(
-                mid_x, mid_y, str(distance), color="purple", fontsize=8, ha="center"
-            )
+            midpoints = segments.mean(axis=1)
+            for (mid_x, mid_y), distance in zip(
+                midpoints, self.game.dist[links[:, 0], links[:, 1]]
+            ):
+                self.ax.text(
+                    mid_x, mid_y, str(distance), color="purple", fontsize=8, ha="center"
+                )
 
-        # Plot factories
-        for i, factory in enumerate(self.game.factories):
-            x, y = positions[i]
-            color = (
-                "grey"
-                if factory.owner == 0
-                else "blue"
-                if factory.owner == 1
-                else "red"
-            )
-            ax.scatter(x, y, c=color, s=100, edgecolors="black")
-            ax.text(
-                x, y, f"{i}\n{factory.cyborgs}", color="black", ha="center", va="center"
-            )
+    def create_artists(self):
+        positions = self.generate_positions()
+        ax = self.ax
 
-        # Plot troops
-        for troop in self.game.troops:
-            x_source, y_source = positions[troop.source_factory]
-            x_destination, y_destination = positions[troop.destination_factory]
-            total_travel_time = self.game.distances.get(
-                (troop.source_factory, troop.destination_factory), 20
-            )
-            progress = (total_travel_time - troop.travel_time) / total_travel_time
-            x_troop = x_source + (x_destination - x_source) * progress
-            y_troop = y_source + (y_destination - y_source) * progress
-            color = "blue" if troop.owner == 1 else "red"
-            ax.scatter(
-                x_troop, y_troop, c=color, s=50, edgecolors="black", marker="^"
-            )  # Plot troop as a triangle
-            ax.text(
-                x_troop,
-                y_troop,
-                f"{troop.num_cyborgs}",
-                color="black",
-                ha="center",
-                va="center",
-            )
+        # Factories
+        self._factories = ax.scatter(
+            positions[:, 0], positions[:, 1], s=100, edgecolors="black", animated=True
+        )
+        self._factory_labels = [
+            ax.text(x, y, "", color="black", ha="center", va="center", animated=True)
+            for x, y in positions
+        ]
+
+        # Troops as triangles and bombs as stars, colored per point by owner
+        empty = np.empty((0, 2))
+        self._troops = ax.scatter(
+            empty[:, 0],
+            empty[:, 1],
+            s=50,
+            edgecolors="black",
+            marker="^",
+            animated=True,
+        )
+        self._troop_labels = []
+        self._bombs = ax.scatter(
+            empty[:, 0],
+            empty[:, 1],
+            s=50,
+            edgecolors="black",
+            marker="*",
+            animated=True,
+        )
 
-        # Plot bombs
-        for bomb in self.game.bombs:
-            x_source, y_source = positions[bomb.source_factory]
-            x_destination, y_destination = positions[bomb.destination_factory]
-            total_travel_time = self.game.distances.get(
-                (bomb.source_factory, bomb.destination_factory), 20
-            )
-            progress = (total_travel_time - bomb.travel_time) / total_travel_time
-            x_bomb = x_source + (x_destination - x_source) * progress
-            y_bomb = y_source + (y_destination - y_source) * progress
-            color = "blue" if bomb.owner == 1 else "red"
-            ax.scatter(
-                x_bomb, y_bomb, c=color, s=50, edgecolors="black", marker="*"
-            )  # Plot bomb as a star
-
-        ax.axis("equal")  # Set equal scaling by changing axis limits
-        plt.title("Game State Visualization")
-        plt.show()
+    def visualize(self):
+        positions = self.generate_positions()
+
+        # Update factories
+        self._factories.set_facecolor(self.OWNER_COLORS[self.game.owner])
+        for i, (label, cyborgs) in enumerate(
+            zip(self._factory_labels, self.game.cyborgs)
+        ):
+            label.set_text(f"{i}\n{cyborgs}")
+
+        # Update troops
+        troops = self.game.troops
+        xy = self.in_flight_positions(positions, troops)
+        labelled = len(troops) <= self.max_labels
+        self._troops.set_offsets(xy)
+        self._troops.set_facecolor(self.OWNER_COLORS[troops.owner])
+        self._troops.set_sizes([50] if labelled else 20 + 4 * troops.num_cyborgs)
+        for label in self._troop_labels:
+            label.remove()
+        self._troop_labels = []
+        if labelled:
+            self._troop_labels = [
+                self.ax.text(
+                    x_troop,
+                    y_troop,
+                    f"{num_cyborgs}",
+                    color="black",
+                    ha="center",
+                    va="center",
+                    animated=True,
+                )
+                for (x_troop, y_troop), num_cyborgs in zip(xy, troops.num_cyborgs)
+            ]
+
+        # Update bombs
+        bombs = self.game.bombs
+        xy = self.in_flight_positions(positions, bombs)
+        self._bombs.set_offsets(xy)
+        self._bombs.set_facecolor(self.OWNER_COLORS[bombs.owner])
+
+        canvas = self.fig.canvas
+        if self._background is None or not canvas.supports_blit:
+            canvas.draw()  # Triggers on_draw
+        else:
+            canvas.restore_region(self._background)
+            self.draw_artists()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def on_draw(self, event):
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_artists()
+
+    def draw_artists(self):
+        artists = [self._factories, *self._factory_labels]
+        artists += [self._troops, *self._troop_labels, self._bombs]
+        for artist in artists:
+            self.ax.draw_artist(artist)
+
+    def in_flight_positions(self, positions, table):
+        # Interpolate every row of a TroopTable between its source and destination
+        total_travel_time = self.game.dist[table.src, table.dst]
+        remaining = table.arrival_turn - self.game.current_turn
+        progress = (total_travel_time - remaining) / total_travel_time
+        source, destination = positions[table.src], positions[table.dst]
+        return source + (destination - source) * progress[:, None]
 
     def generate_positions(self):
+        return self._positions
+
+    def compute_positions(self):
         # A simple heuristic approach to distribute factories in 2D space
-        angle_step = 360 / len(self.game.factories)
-        positions = {}
+        factory_count = len(self.game.factories)
+        angles = np.deg2rad(np.arange(factory_count) * (360 / factory_count))
         radius = 10  # Radius of the circle on which factories are placed
-        for i in range(len(self.game.factories)):
-            angle = np.deg2rad(angle_step * i)
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            positions[i] = (x, y)
-        return positions
+        return np.stack([radius * np.cos(angles), radius * np.sin(angles)], axis=1)
 
 
-class Bomb:
-    def __init__(self, owner, source_factory, destination_factory, travel_time):
-        self.owner = owner
-        self.source_factory = source_factory
-        self.destination_factory = destination_factory
-        self.travel_time = travel_time
+def _factory_field(name):
+    # Read and write one factory's entry in the Game array called name
+    return property(
+        lambda self: int(getattr(self.game, name)[self.index]),
+        lambda self, value: getattr(self.game, name).__setitem__(self.index, value),
+    )
 
 
 class Factory:
-    def __init__(self, owner, cyborgs):
-        self.owner = owner  # 0 for neutral, 1 for player 1, 2 for player 2
-        self.cyborgs = cyborgs
-        # Production rate is now variable between 0 and 3 for non-neutral factories
-        self.production = random.randint(0, 3) if owner != 0 else 0
-        self.production_disabled = False
+    """View of one factory's entries in the Game factory arrays."""
 
+    owner = _factory_field("owner")  # 0 for neutral, 1 for player 1, 2 for player 2
+    cyborgs = _factory_field("cyborgs")
+    production = _factory_field("production")
+    production_disabled = _factory_field("prod_disabled")
 
-class Troop:
-    def __init__(
-        self, owner, num_cyborgs, source_factory, destination_factory, travel_time
-    ):
-        self.owner = owner
-        self.num_cyborgs = num_cyborgs
-        self.source_factory = source_factory
-        self.destination_factory = destination_factory
-        self.travel_time = travel_time
+    def __init__(self, game, index):
+        self.game = game
+        self.index = index
+
+
+def _column(name):
+    # Expose only the live rows of a TroopTable column buffer
+    return property(lambda self: getattr(self, "_" + name)[: self.size])
+
+
+class TroopTable:
+    """Structure-of-arrays storage for troops (or bombs) in flight.
+
+    Every column is a contiguous ``np.int32`` buffer; only the first ``size``
+    rows are live. Capacity doubles whenever an append would overflow.
+    """
+
+    COLUMNS = ("owner", "num_cyborgs", "src", "dst", "arrival_turn")
+
+    owner = _column("owner")
+    num_cyborgs = _column("num_cyborgs")
+    src = _column("src")
+    dst = _column("dst")
+    arrival_turn = _column("arrival_turn")
+
+    def __init__(self, capacity=16):
+        self.size = 0
+        self.capacity = capacity
+        for name in self.COLUMNS:
+            setattr(self, "_" + name, np.zeros(capacity, dtype=np.int32))
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def concatenate(cls, tables):
+        # Gather the rows of several tables, in order, into a new table
+        size = sum(len(table) for table in tables)
+        combined = cls(max(size, 1))
+        for name in cls.COLUMNS:
+            np.concatenate(
+                [getattr(table, name) for table in tables],
+                out=getattr(combined, "_" + name)[:size],
+            )
+        combined.size = size
+        return combined
+
+    def append(self, owner, num_cyborgs, src, dst, arrival_turn):
+        if self.size == self.capacity:
+            self.capacity *= 2
+            for name in self.COLUMNS:
+                setattr(
+                    self,
+                    "_" + name,
+                    np.resize(getattr(self, "_" + name), self.capacity),
+                )
+        i = self.size
+        self._owner[i] = owner
+        self._num_cyborgs[i] = num_cyborgs
+        self._src[i] = src
+        self._dst[i] = dst
+        self._arrival_turn[i] = arrival_turn
+        self.size += 1
+
+    def clear(self):
+        self.size = 0
+
+
+def _arrive(owner, num_cyborgs, dst, totals, present):
+    """Sum arriving cyborgs into ``totals[dst, owner]`` and flag ``present``."""
+    for i in range(dst.shape[0]):
+        totals[dst[i], owner[i]] += num_cyborgs[i]
+        present[dst[i], owner[i]] = 1
+
+
+try:
+    from _tick import arrive as _arrive_kernel  # Cython build, see setup.py
+except ImportError:
+    _arrive_kernel = njit(cache=True)(_arrive) if njit is not None else None
+
+
+@functools.lru_cache(maxsize=65536)
+def _battle_outcome(player1, player2, owner, cyborgs):
+    """Resolve a battle at a factory held by owner with cyborgs defenders.
+
+    player1 and player2 are the cyborgs each player has arriving, or None if
+    none of their troops arrived; at least one of them is set. Returns
+    (new_owner, new_cyborgs, captured); drawing the production rate of a
+    captured factory is left to the caller, so the outcome stays a pure
+    function that can be memoized.
+    """
+    # Troops of both players arriving together fight each other first;
+    # player 1 keeps the field, with no cyborgs left, on a tie
+    if player1 is not None and player2 is not None:
+        if player1 >= player2:
+            attacker, attacking_force = 1, player1 - player2
+        else:
+            attacker, attacking_force = 2, player2 - player1
+    elif player1 is not None:
+        attacker, attacking_force = 1, player1
+    else:
+        attacker, attacking_force = 2, player2
+
+    # Battle with factory defenders
+    if attacker == owner:
+        # Reinforce if the factory's owner has arriving troops
+        return owner, cyborgs + attacking_force, False
+    if attacking_force > cyborgs:
+        # Factory is conquered
+        return attacker, attacking_force - cyborgs, True
+    return owner, cyborgs - attacking_force, False  # Defenders repel the attack
 
 
 class Game:
     def __init__(self, factory_count, link_count):
-        self.factories = []
-        self.troops = []
-        self.bombs = []
-        self.distances = {}
+        # Factory state is kept as arrays; factories holds a view per factory
+        self.owner = np.zeros(factory_count, dtype=np.int16)
+        self.cyborgs = np.zeros(factory_count, dtype=np.int16)
+        self.production = np.zeros(factory_count, dtype=np.int16)
+        self.prod_disabled = np.zeros(factory_count, dtype=np.int16)
+        self.factories = [Factory(self, i) for i in range(factory_count)]
+        self.links = np.empty((0, 2), dtype=np.intp)  # (f1, f2) pairs, f1 < f2
+        self.dist = np.full((factory_count, factory_count), 20, dtype=np.int16)
         self.initialize_factories(factory_count)
         self.initialize_distances(factory_count, link_count)
 
+        # Troops and bombs are scheduled in a ring of arrival buckets: the
+        # bucket at arrival_turn % len(buckets) holds everything arriving on
+        # that turn, so a turn only touches what actually arrives
+        self.current_turn = 0
+        bucket_count = int(self.dist.max()) + 1
+        self.troop_buckets = [TroopTable() for _ in range(bucket_count)]
+        self.bomb_buckets = [TroopTable() for _ in range(bucket_count)]
+
+    @property
+    def troops(self):
+        # All troops in flight; remaining turns are arrival_turn - current_turn
+        return TroopTable.concatenate(self.troop_buckets)
+
+    @property
+    def bombs(self):
+        return TroopTable.concatenate(self.bomb_buckets)
+
     def initialize_factories(self, factory_count):
-        for _ in range(factory_count):
-            self.factories.append(
-                Factory(0, random.randint(15, 30))
-            )  # Neutral factories
+        # All factories start neutral, and neutral factories do not produce
+        self.cyborgs[:] = np.random.randint(15, 31, size=factory_count)
         # Assign initial factories to players
-        self.factories[0].owner, self.factories[0].production = 1, random.randint(0, 3)
-        self.factories[1].owner, self.factories[1].production = 2, random.randint(0, 3)
+        self.owner[:2] = 1, 2
+        self.production[:2] = np.random.randint(0, 4, size=2)
 
     def initialize_distances(self, factory_count, link_count):
-        # Simulate links and distances based on the provided constraints
-        links = set()
-        while len(links) < 2 * link_count:
-            f1, f2 = random.sample(range(factory_count), 2)
-            if (f1, f2) not in links and (f2, f1) not in links:
-                distance = random.randint(1, 20)
-                self.distances[(f1, f2)] = distance
-                self.distances[(f2, f1)] = distance  # Ensure symmetry
-                links.add((f1, f2))
+        # Simulate links and distances based on the provided constraints:
+        # pick 2 * link_count distinct unordered pairs in one draw
+        f1, f2 = np.triu_indices(factory_count, k=1)
+        chosen = np.random.choice(len(f1), size=2 * link_count, replace=False)
+        self.links = np.stack([f1[chosen], f2[chosen]], axis=1)
+        distances = np.random.randint(1, 21, size=len(chosen), dtype=np.int16)
+        self.dist[f1[chosen], f2[chosen]] = distances
+        self.dist[f2[chosen], f1[chosen]] = distances  # Ensure symmetry
 
     def send_troop(self, owner, num_cyborgs, source_factory, destination_factory):
-        if self.factories[source_factory].owner != owner:
+        if self.owner[source_factory] != owner:
             raise ValueError("You do not own the source factory.")
-        travel_time = self.distances.get((source_factory, destination_factory), 20)
-        self.troops.append(
-            Troop(owner, num_cyborgs, source_factory, destination_factory, travel_time)
+        travel_time = int(self.dist[source_factory, destination_factory])
+        arrival_turn = self.current_turn + travel_time
+        self.troop_buckets[arrival_turn % len(self.troop_buckets)].append(
+            owner, num_cyborgs, source_factory, destination_factory, arrival_turn
         )
-        self.factories[source_factory].cyborgs -= num_cyborgs
+        self.cyborgs[source_factory] -= num_cyborgs
 
     def send_bomb(self, owner, source_factory, destination_factory):
-        if self.factories[source_factory].owner != owner:
+        if self.owner[source_factory] != owner:
             raise ValueError("You do not own the source factory.")
-        travel_time = self.distances.get((source_factory, destination_factory), 20)
-        self.bombs.append(Bomb(owner, source_factory, destination_factory, travel_time))
+        travel_time = int(self.dist[source_factory, destination_factory])
+        arrival_turn = self.current_turn + travel_time
+        self.bomb_buckets[arrival_turn % len(self.bomb_buckets)].append(
+            owner, 0, source_factory, destination_factory, arrival_turn
+        )
 
     def update(self):
-        # Move existing troops and prepare for battles
+        self.current_turn += 1
+
+        # Land the troops arriving this turn and resolve their battles
         self.update_troops()
 
-        # Update bombs
+        # Land the bombs arriving this turn
         self.update_bombs()
 
         # Produce new cyborgs in all factories
-        for factory in self.factories:
-            if (
-                factory.owner != 0 and factory.production_disabled == 0
-            ):  # Neutral factories do not produce
-                factory.cyborgs += factory.production
-            elif factory.production_disabled > 0:
-                factory.production_disabled -= (
-                    1  # Decrease the production disabled counter
-                )
+        # Neutral factories do not produce
+        active = (self.owner != 0) & (self.prod_disabled == 0)
+        self.cyborgs[active] += self.production[active]
+        # Decrease the production disabled counters
+        self.prod_disabled[self.prod_disabled > 0] -= 1
 
     def update_troops(self):
-        battles = {}  # Dictionary to organize battles by destination factory
-        for troop in self.troops[:]:
-            troop.travel_time -= 1
-            if troop.travel_time == 0:
-                dest = troop.destination_factory
-                if dest not in battles:
-                    battles[dest] = []
-                battles[dest].append(troop)
-                self.troops.remove(troop)
+        arriving = self.troop_buckets[self.current_turn % len(self.troop_buckets)]
+        if not len(arriving):
+            return  # Nothing arrives this turn
+
+        # Sum arriving cyborgs by (destination factory, owner)
+        totals = np.zeros((len(self.owner), 3), dtype=np.int32)
+        present = np.zeros((len(self.owner), 3), dtype=np.uint8)
+        dst, owner = arriving.dst, arriving.owner
+        if _arrive_kernel is not None:
+            _arrive_kernel(owner, arriving.num_cyborgs, dst, totals, present)
+        else:
+            np.add.at(totals, (dst, owner), arriving.num_cyborgs)
+            present[dst, owner] = 1
+        arriving.clear()
 
         # Now, solve battles
-        for dest, troops in battles.items():
-            self.resolve_battle(dest, troops)
+        for dest in np.flatnonzero(present.any(axis=1)):
+            self.resolve_battle(dest, totals[dest], present[dest])
 
     def update_bombs(self):
-        # Similar to previous bomb update implementation
-        for bomb in self.bombs[:]:
-            bomb.travel_time -= 1
-            if bomb.travel_time == 0:
-                self.resolve_bomb(bomb)
-                self.bombs.remove(bomb)
-
-    def resolve_bomb(self, bomb):
-        factory = self.factories[bomb.destination_factory]
-        destroyed_cyborgs = max(10, factory.cyborgs // 2)
-        factory.cyborgs -= destroyed_cyborgs
-        factory.production_disabled = 5  # Disable production for 5 turns
-
-    def resolve_battle(self, destination_factory, arriving_troops):
-        # Group arriving troops by owner
-        combatants = {}
-        for troop in arriving_troops:
-            if troop.owner not in combatants:
-                combatants[troop.owner] = 0
-            combatants[troop.owner] += troop.num_cyborgs
-
-        # Determine the outcome of battles between different arriving troops
-        if len(combatants) > 1:
-            # Sort combatants by the number of cyborgs descending
-            sorted_combatants = sorted(
-                combatants.items(), key=lambda x: x[1], reverse=True
-            )
-            winner, winner_cyborgs = sorted_combatants[0]
-            for loser, loser_cyborgs in sorted_combatants[1:]:
-                winner_cyborgs -= loser_cyborgs  # Battle resolution
-            combatants = {winner: max(0, winner_cyborgs)}  # Only the winner remains
+        arriving = self.bomb_buckets[self.current_turn % len(self.bomb_buckets)]
+        for dest in arriving.dst:
+            self.resolve_bomb(dest)
+        arriving.clear()
+
+    def resolve_bomb(self, destination_factory):
+        destroyed_cyborgs = max(10, self.cyborgs[destination_factory] // 2)
+        self.cyborgs[destination_factory] -= destroyed_cyborgs
+        self.prod_disabled[destination_factory] = 5  # Disable production for 5 turns
+
+    def resolve_battle(self, destination_factory, arriving_cyborgs, present):
+        # Arriving troops are summed by owner; present flags owners with arrivals
+        player1 = int(arriving_cyborgs[1]) if present[1] else None
+        player2 = int(arriving_cyborgs[2]) if present[2] else None
 
         # Battle with factory defenders
-        factory = self.factories[destination_factory]
-        if factory.owner in combatants:
-            # Reinforce if the factory's owner has arriving troops
-            factory.cyborgs += combatants[factory.owner]
-        else:
-            # Determine the strongest attacking force
-            attacking_force = max(combatants.values()) if combatants else 0
-            if attacking_force > factory.cyborgs:
-                # Factory is conquered
-                new_owner = max(combatants, key=combatants.get)
-                factory.owner = new_owner
-                factory.cyborgs = attacking_force - factory.cyborgs
-                factory.production = random.randint(
-                    0, 3
-                )  # Set new production rate for the conquering player
-            else:
-                factory.cyborgs -= attacking_force  # Defenders repel the attack
+        owner, cyborgs, captured = _battle_outcome(
+            player1,
+            player2,
+            int(self.owner[destination_factory]),
+            int(self.cyborgs[destination_factory]),
+        )
+        self.owner[destination_factory] = owner
+        self.cyborgs[destination_factory] = cyborgs
+        if captured:
+            # Set new production rate for the conquering player
+            self.production[destination_factory] = np.random.randint(0, 4)
 
     def display_factories(self):
         for index, factory in enumerate(self.factories):
@@ -271,4 +460,5 @@ game.send_bomb(1, 0, 6)
 game.update()  # Simulate a turn
 game.update()  # Simulate a turn
 visualizer.visualize()
+plt.show()
 exit()
@@ -0,0 +1,9 @@
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# Builds the compiled arrival pass used by referee.py:
+#     python setup.py build_ext --inplace
+setup(
+    name="ghost-in-the-cell-referee",
+    ext_modules=cythonize([Extension("_tick", ["_tick.pyx"])]),
+)